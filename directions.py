@@ -0,0 +1,16 @@
+"""
+Direction Constants for EntropyWalker
+=====================================
+
+Single definition of the direction order shared by the walkers, the
+statistics tracker and the graphs. Every per-direction table and count
+array is indexed in this order: 0=UP, 1=DOWN, 2=LEFT, 3=RIGHT.
+"""
+
+from typing import Dict, Literal, Tuple
+
+# Type alias for directions
+Direction = Literal['UP', 'DOWN', 'LEFT', 'RIGHT']
+
+DIRECTION_NAMES: Tuple[Direction, ...] = ('UP', 'DOWN', 'LEFT', 'RIGHT')
+DIRECTION_INDEX: Dict[Direction, int] = {name: idx for idx, name in enumerate(DIRECTION_NAMES)}
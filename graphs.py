@@ -7,7 +7,7 @@ performance. Charts are saved to file and opened in the system image
 viewer to avoid pygame/matplotlib threading conflicts.
 
 Charts generated:
-    - Direction histogram (Left: Python Random, Right: TrueEntropy)
+    - Direction histogram (Left: Mersenne Twister, Right: TrueEntropy)
     - Distance from origin distribution (overlaid comparison)
     - Normalized metrics comparison bar chart
 """
@@ -15,21 +15,188 @@ Charts generated:
 import os
 import subprocess
 import sys
+from typing import List, Optional, Sequence
 
+import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for thread safety
 import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.container import BarContainer
+from matplotlib.figure import Figure
+from matplotlib.text import Text
 
-from stats import StatsTracker
+from directions import DIRECTION_NAMES
+from stats import DISTANCE_BUCKET_SIZE, StatsTracker
 
 
 # Color constants matching main application palette
-LEFT_COLOR = '#00ffc8'   # Cyan for Python Random
+LEFT_COLOR = '#00ffc8'   # Cyan for Mersenne Twister
 RIGHT_COLOR = '#ff6432'  # Orange for TrueEntropy
 
+METRICS = ['Dispersion\n(avg dist)', 'Entropy\n(max 2.0)', 'Return\n(%)']
+BAR_WIDTH = 0.35
+
+
+class _GraphCache:
+    """
+    Figure and artists reused across repeated graph requests.
+    
+    Layout, titles and axes are identical between calls, so the figure is
+    built once and later calls only update bar heights, histogram data and
+    text labels.
+    
+    Attributes:
+        left_name: Display label the figure was built with (left side).
+        right_name: Display label the figure was built with (right side).
+        fig: The cached matplotlib figure.
+        axes: 2x2 array of subplot axes.
+        bars1: Direction bars for the left generator.
+        bars2: Direction bars for the right generator.
+        bars4_left: Normalized metric bars for the left generator.
+        bars4_right: Normalized metric bars for the right generator.
+        hist_left: Distance histogram outline for the left generator.
+        hist_right: Distance histogram outline for the right generator.
+        labels1: Value labels above bars1.
+        labels2: Value labels above bars2.
+        labels4_left: Actual metric values above bars4_left.
+        labels4_right: Actual metric values above bars4_right.
+    """
+
+    def __init__(self, left_name: str, right_name: str):
+        """
+        Build the figure and all of its artists with placeholder values.
+        
+        Args:
+            left_name: Display label for left generator.
+            right_name: Display label for right generator.
+        """
+        self.left_name = left_name
+        self.right_name = right_name
+        
+        self.fig: Figure
+        self.fig, self.axes = plt.subplots(2, 2, figsize=(12, 8))
+        self.fig.suptitle('EntropyWalker: Distribution Comparison', fontsize=14, fontweight='bold')
+        
+        # =====================================================================
+        # Chart 1 & 2: Direction Distribution - Left / Right Generator
+        # =====================================================================
+        self.bars1, self.labels1 = self._build_direction_chart(
+            self.axes[0, 0], left_name, LEFT_COLOR)
+        self.bars2, self.labels2 = self._build_direction_chart(
+            self.axes[0, 1], right_name, RIGHT_COLOR)
+        
+        # =====================================================================
+        # Chart 3: Distance Distribution - Overlaid Comparison
+        # =====================================================================
+        ax3 = self.axes[1, 0]
+        empty_counts = np.zeros(1)
+        empty_edges = np.array([0.0, float(DISTANCE_BUCKET_SIZE)])
+        self.hist_left = ax3.stairs(empty_counts, empty_edges, fill=True, alpha=0.6,
+                                    color=LEFT_COLOR, label=left_name)
+        self.hist_right = ax3.stairs(empty_counts, empty_edges, fill=True, alpha=0.6,
+                                     color=RIGHT_COLOR, label=right_name)
+        ax3.set_title('Distance from Origin Distribution')
+        ax3.set_xlabel('Distance (pixels)')
+        ax3.set_ylabel('Frequency')
+        ax3.legend()
+        
+        # =====================================================================
+        # Chart 4: Normalized Metrics Comparison
+        # =====================================================================
+        ax4 = self.axes[1, 1]
+        x = range(len(METRICS))
+        zeros = [0.0] * len(METRICS)
+        self.bars4_left = ax4.bar([i - BAR_WIDTH/2 for i in x], zeros, BAR_WIDTH, label=left_name,
+                                  color=LEFT_COLOR, edgecolor='white', alpha=0.8)
+        self.bars4_right = ax4.bar([i + BAR_WIDTH/2 for i in x], zeros, BAR_WIDTH, label=right_name,
+                                   color=RIGHT_COLOR, edgecolor='white', alpha=0.8)
+        ax4.set_xticks(x)
+        ax4.set_xticklabels(METRICS)
+        ax4.set_title('Metrics Comparison (Normalized)')
+        ax4.set_ylabel('Normalized Value')
+        ax4.legend()
+        self.labels4_left = [ax4.text(i - BAR_WIDTH/2, 0, '', ha='center', fontsize=8) for i in x]
+        self.labels4_right = [ax4.text(i + BAR_WIDTH/2, 0, '', ha='center', fontsize=8) for i in x]
+
+    @staticmethod
+    def _build_direction_chart(ax: Axes, name: str, color: str):
+        """Create the direction bars, ideal line and value labels for one generator."""
+        bars = ax.bar(DIRECTION_NAMES, [0.0] * len(DIRECTION_NAMES), color=color, edgecolor='white', alpha=0.8)
+        ax.axhline(y=25, color='red', linestyle='--', label='Ideal (25%)')
+        ax.set_title(f'{name} - Direction Distribution')
+        ax.set_ylabel('Percentage (%)')
+        ax.set_ylim(0, 35)
+        ax.legend()
+        
+        labels = [ax.text(bar.get_x() + bar.get_width()/2, 0, '', ha='center', va='bottom', fontsize=9)
+                  for bar in bars]
+        return bars, labels
+
+
+_graph_cache: Optional[_GraphCache] = None
+
+
+def _get_graph_cache(left_name: str, right_name: str) -> _GraphCache:
+    """Return the cached figure, rebuilding it if the generator labels changed."""
+    global _graph_cache
+    if (_graph_cache is None or _graph_cache.left_name != left_name
+            or _graph_cache.right_name != right_name):
+        if _graph_cache is not None:
+            plt.close(_graph_cache.fig)
+        _graph_cache = _GraphCache(left_name, right_name)
+    return _graph_cache
+
+
+def _update_direction_chart(bars: BarContainer, labels: List[Text], values: Sequence[float]) -> None:
+    """Set bar heights and value labels for a direction distribution chart."""
+    for bar, label, val in zip(bars, labels, values):
+        bar.set_height(val)
+        label.set_y(val + 0.5)
+        label.set_text(f'{val:.1f}%')
+
+
+def _update_distance_histogram(cache: _GraphCache, stats_left: StatsTracker,
+                               stats_right: StatsTracker) -> None:
+    """
+    Refresh the overlaid distance-from-origin histogram.
+    
+    Draws the trackers' incrementally maintained DISTANCE_BUCKET_SIZE
+    bucket counts directly, trimmed to the range occupied on either side,
+    so no distance samples are re-binned here.
+    """
+    counts_left = stats_left.get_distance_distribution()
+    counts_right = stats_right.get_distance_distribution()
+    
+    ax3 = cache.axes[1, 0]
+    visible = bool(counts_left.any() and counts_right.any())
+    cache.hist_left.set_visible(visible)
+    cache.hist_right.set_visible(visible)
+    if not visible:
+        # Don't leave the previous run's range around an empty plot
+        ax3.set_xlim(0, 1)
+        ax3.set_ylim(0, 1)
+        return
+    
+    # Share bucket edges between both sides (pad if their geometry differs)
+    size = max(len(counts_left), len(counts_right))
+    padded_left = np.zeros(size)
+    padded_right = np.zeros(size)
+    padded_left[:len(counts_left)] = counts_left
+    padded_right[:len(counts_right)] = counts_right
+    occupied = np.flatnonzero(padded_left + padded_right)
+    lo, hi = occupied[0], occupied[-1] + 1
+    edges = np.arange(lo, hi + 1, dtype=np.float64) * DISTANCE_BUCKET_SIZE
+    cache.hist_left.set_data(padded_left[lo:hi], edges)
+    cache.hist_right.set_data(padded_right[lo:hi], edges)
+    
+    ax3.set_autoscale_on(True)  # set_*lim in the empty case turned it off
+    ax3.relim()
+    ax3.autoscale_view()
+
 
 def show_distribution_graphs(stats_left: StatsTracker, stats_right: StatsTracker,
-                              left_name: str = "Python Random", 
+                              left_name: str = "Mersenne Twister (NumPy MT19937)", 
                               right_name: str = "TrueEntropy") -> None:
     """
     Generate and display distribution comparison graphs.
@@ -40,72 +207,32 @@ def show_distribution_graphs(stats_left: StatsTracker, stats_right: StatsTracker
         - Bottom-left: Overlaid distance distribution histogram
         - Bottom-right: Normalized metrics comparison
     
+    The figure is built on the first call and reused afterwards; only the
+    plotted data is refreshed.
+    
     Args:
-        stats_left: StatsTracker instance for left side (Python random).
+        stats_left: StatsTracker instance for left side (Mersenne Twister).
         stats_right: StatsTracker instance for right side (TrueEntropy).
         left_name: Display label for left generator.
         right_name: Display label for right generator.
     """
-    fig, axes = plt.subplots(2, 2, figsize=(12, 8))
-    fig.suptitle('EntropyWalker: Distribution Comparison', fontsize=14, fontweight='bold')
-    
-    directions = ['UP', 'DOWN', 'LEFT', 'RIGHT']
-    
-    # =========================================================================
-    # Chart 1: Direction Distribution - Left Generator
-    # =========================================================================
-    ax1 = axes[0, 0]
-    left_dist = stats_left.get_direction_distribution()
-    values_left = [left_dist[d] for d in directions]
-    bars1 = ax1.bar(directions, values_left, color=LEFT_COLOR, edgecolor='white', alpha=0.8)
-    ax1.axhline(y=25, color='red', linestyle='--', label='Ideal (25%)')
-    ax1.set_title(f'{left_name} - Direction Distribution')
-    ax1.set_ylabel('Percentage (%)')
-    ax1.set_ylim(0, 35)
-    ax1.legend()
-    
-    # Add value labels on bars
-    for bar, val in zip(bars1, values_left):
-        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, 
-                f'{val:.1f}%', ha='center', va='bottom', fontsize=9)
+    cache = _get_graph_cache(left_name, right_name)
     
     # =========================================================================
-    # Chart 2: Direction Distribution - Right Generator
+    # Chart 1 & 2: Direction Distribution
     # =========================================================================
-    ax2 = axes[0, 1]
-    right_dist = stats_right.get_direction_distribution()
-    values_right = [right_dist[d] for d in directions]
-    bars2 = ax2.bar(directions, values_right, color=RIGHT_COLOR, edgecolor='white', alpha=0.8)
-    ax2.axhline(y=25, color='red', linestyle='--', label='Ideal (25%)')
-    ax2.set_title(f'{right_name} - Direction Distribution')
-    ax2.set_ylabel('Percentage (%)')
-    ax2.set_ylim(0, 35)
-    ax2.legend()
-    
-    # Add value labels on bars
-    for bar, val in zip(bars2, values_right):
-        ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, 
-                f'{val:.1f}%', ha='center', va='bottom', fontsize=9)
+    _update_direction_chart(cache.bars1, cache.labels1, stats_left.get_direction_percentages())
+    _update_direction_chart(cache.bars2, cache.labels2, stats_right.get_direction_percentages())
     
     # =========================================================================
     # Chart 3: Distance Distribution - Overlaid Comparison
     # =========================================================================
-    ax3 = axes[1, 0]
-    if stats_left.distance_history and stats_right.distance_history:
-        ax3.hist(stats_left.distance_history, bins=30, alpha=0.6, color=LEFT_COLOR, 
-                 label=left_name, edgecolor='white')
-        ax3.hist(stats_right.distance_history, bins=30, alpha=0.6, color=RIGHT_COLOR, 
-                 label=right_name, edgecolor='white')
-    ax3.set_title('Distance from Origin Distribution')
-    ax3.set_xlabel('Distance (pixels)')
-    ax3.set_ylabel('Frequency')
-    ax3.legend()
+    _update_distance_histogram(cache, stats_left, stats_right)
     
     # =========================================================================
     # Chart 4: Normalized Metrics Comparison
     # =========================================================================
-    ax4 = axes[1, 1]
-    metrics = ['Dispersion\n(avg dist)', 'Entropy\n(max 2.0)', 'Return\n(%)']
+    ax4 = cache.axes[1, 1]
     left_stats = stats_left.get_stats_dict()
     right_stats = stats_right.get_stats_dict()
     
@@ -117,38 +244,27 @@ def show_distribution_graphs(stats_left: StatsTracker, stats_right: StatsTracker
     left_normalized = [left_values[0]/max_disp * 100, left_values[1] * 50, left_values[2]]
     right_normalized = [right_values[0]/max_disp * 100, right_values[1] * 50, right_values[2]]
     
-    x = range(len(metrics))
-    width = 0.35
-    ax4.bar([i - width/2 for i in x], left_normalized, width, label=left_name, 
-            color=LEFT_COLOR, edgecolor='white', alpha=0.8)
-    ax4.bar([i + width/2 for i in x], right_normalized, width, label=right_name, 
-            color=RIGHT_COLOR, edgecolor='white', alpha=0.8)
-    ax4.set_xticks(x)
-    ax4.set_xticklabels(metrics)
-    ax4.set_title('Metrics Comparison (Normalized)')
-    ax4.set_ylabel('Normalized Value')
-    ax4.legend()
-    
-    # Add actual values as text labels
-    for i, (lv, rv) in enumerate(zip(left_values, right_values)):
-        if i == 0:  # Dispersion
-            ax4.text(i - width/2, left_normalized[i] + 2, f'{lv:.0f}px', ha='center', fontsize=8)
-            ax4.text(i + width/2, right_normalized[i] + 2, f'{rv:.0f}px', ha='center', fontsize=8)
-        elif i == 1:  # Entropy
-            ax4.text(i - width/2, left_normalized[i] + 2, f'{lv:.2f}', ha='center', fontsize=8)
-            ax4.text(i + width/2, right_normalized[i] + 2, f'{rv:.2f}', ha='center', fontsize=8)
-        else:  # Return rate
-            ax4.text(i - width/2, left_normalized[i] + 2, f'{lv:.1f}%', ha='center', fontsize=8)
-            ax4.text(i + width/2, right_normalized[i] + 2, f'{rv:.1f}%', ha='center', fontsize=8)
-    
-    plt.tight_layout()
+    # Actual values as text labels: dispersion, entropy, return rate
+    formats = ['{:.0f}px', '{:.2f}', '{:.1f}%']
+    for bars, labels, normalized, values in (
+            (cache.bars4_left, cache.labels4_left, left_normalized, left_values),
+            (cache.bars4_right, cache.labels4_right, right_normalized, right_values)):
+        for bar, label, norm, val, fmt in zip(bars, labels, normalized, values, formats):
+            bar.set_height(norm)
+            label.set_y(norm + 2)
+            label.set_text(fmt.format(val))
+    ax4.relim()
+    ax4.autoscale_view()
+    
+    cache.fig.tight_layout()
     
     # =========================================================================
     # Save and Open
     # =========================================================================
     output_path = os.path.join(os.path.dirname(__file__), 'distribution_graphs.png')
-    plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close(fig)
+    # Flat-color charts gain little from heavy zlib compression; favor speed
+    cache.fig.savefig(output_path, dpi=150, facecolor='white',
+                      pil_kwargs={'compress_level': 1, 'optimize': False})
     
     # Open in system default image viewer
     if sys.platform == 'win32':
@@ -159,5 +275,3 @@ def show_distribution_graphs(stats_left: StatsTracker, stats_right: StatsTracker
         subprocess.run(['xdg-open', output_path])
     
     print(f"Graph saved to: {output_path}")
-
-
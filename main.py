@@ -6,7 +6,10 @@ A real-time simulation comparing Python's Mersenne Twister properties against
 the 'trueentropy' library using a split-screen random walk visualization.
 
 Usage:
-    python main.py
+    python main.py [--gpu]
+
+Options:
+    --gpu - Record statistics with the CUDA kernel (needs numba + a CUDA GPU)
 
 Controls:
     ESC - Quit
@@ -16,24 +19,33 @@ Controls:
     G   - Show distribution graphs
 """
 
+import argparse
+import copy
+import functools
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 import pygame
-import random
-from typing import NoReturn, Tuple, List
+import numpy as np
+from typing import Callable, Dict, NoReturn, Optional, Tuple, List
 
-from walker import RandomWalker, Direction
-from stats import StatsTracker
+from stats import StatsTracker, cuda_available
+from walker import WalkerSwarm
 from graphs import show_distribution_graphs
 import trueentropy
 
 # --- Configuration & Constants ---
+STD_SOURCE_NAME = "Mersenne Twister (NumPy MT19937)"
 ENTROPY_SOURCE_NAME = "TrueEntropy (HYBRID)"
 NUM_WALKERS = 15  # Number of walkers per side
 CELL_SIZE = 10    # Heatmap cell size in pixels
+STEP_SIZE = 3     # Pixels moved per walker step
 
 WIDTH: int = 1200
 HEIGHT: int = 600
 FPS: int = 60
+HEAD_RADIUS: int = 2
+PARALLEL_UPDATE_MIN_WALKERS: int = 10_000  # Below this, thread hand-off costs more than it saves
+HUD_REFRESH_FRAMES: int = 12  # Redraw HUD text every N frames (~5 Hz at 60 FPS)
 
 # Colors (R, G, B)
 BG_COLOR: Tuple[int, int, int] = (10, 10, 15)
@@ -42,9 +54,20 @@ TEXT_COLOR: Tuple[int, int, int] = (150, 150, 150)
 WHITE: Tuple[int, int, int] = (255, 255, 255)
 
 # Base colors for each side
-LEFT_BASE_COLOR: Tuple[int, int, int] = (0, 255, 200)   # Cyan for Python Random
+LEFT_BASE_COLOR: Tuple[int, int, int] = (0, 255, 200)   # Cyan for Mersenne Twister
 RIGHT_BASE_COLOR: Tuple[int, int, int] = (255, 100, 50) # Orange for TrueEntropy
 
+# Left-side generator: Mersenne Twister (same core algorithm as the random module),
+# drawn through NumPy so a whole frame of directions is one C call
+_rng_std = np.random.Generator(np.random.MT19937())
+
+# Single background worker so rendering graphs never blocks the frame loop
+_graph_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="graphs")
+
+# Two workers to advance both sides concurrently (NumPy releases the GIL);
+# only used for swarms of at least PARALLEL_UPDATE_MIN_WALKERS per side
+_update_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="walkers")
+
 def generate_color_variants(base_color: Tuple[int, int, int], count: int) -> List[Tuple[int, int, int]]:
     """Generate color variants with slight hue/saturation shifts."""
     colors = []
@@ -54,61 +77,138 @@ def generate_color_variants(base_color: Tuple[int, int, int], count: int) -> Lis
         colors.append(new_color)
     return colors
 
-def get_random_direction_std() -> Direction:
-    """Returns a direction using Python's standard random module."""
-    return random.choice(['UP', 'DOWN', 'LEFT', 'RIGHT'])
-
-def get_random_direction_true() -> Direction:
-    """Returns a direction using the trueentropy library."""
-    return trueentropy.choice(['UP', 'DOWN', 'LEFT', 'RIGHT'])
-
-def heat_to_color(value: float) -> Tuple[int, int, int]:
-    """Convert heat value (0-1) to color (blue -> green -> yellow -> red)."""
-    if value < 0.25:
-        t = value / 0.25
-        return (0, int(t * 255), 255)  # Blue to Cyan
-    elif value < 0.5:
-        t = (value - 0.25) / 0.25
-        return (0, 255, int(255 * (1 - t)))  # Cyan to Green
-    elif value < 0.75:
-        t = (value - 0.5) / 0.25
-        return (int(t * 255), 255, 0)  # Green to Yellow
-    else:
-        t = (value - 0.75) / 0.25
-        return (255, int(255 * (1 - t)), 0)  # Yellow to Red
+def get_random_directions_std(count: int) -> np.ndarray:
+    """Returns `count` direction indices using the Mersenne Twister (NumPy's MT19937)."""
+    return _rng_std.integers(0, 4, count, dtype=np.uint8)
+
+def get_random_directions_true(count: int) -> np.ndarray:
+    """Returns `count` direction indices using the trueentropy library."""
+    return np.frombuffer(trueentropy.randbytes(count), dtype=np.uint8) & 3
+
+def update_side(swarm: WalkerSwarm, sample: Callable[[int], np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sample directions and advance one side's walkers (pure NumPy, no pygame calls).
+
+    Returns:
+        Tuple of (previous xs, previous ys, sampled direction indices).
+    """
+    dir_idx = sample(len(swarm))
+    old_xs, old_ys = swarm.step(dir_idx)
+    return old_xs, old_ys, dir_idx
+
+def draw_trail_segments(surface: pygame.Surface, colors: np.ndarray,
+                        old_xs: np.ndarray, old_ys: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> None:
+    """
+    Rasterize the latest step of every walker onto the persistent trail surface.
+
+    All segments are sampled at once and written through a single fancy-index
+    assignment into the surface's pixel memory, instead of one draw call each.
+
+    Args:
+        surface: Trail surface to draw on.
+        colors: (N, 3) uint8 array with one RGB color per walker.
+        old_xs, old_ys: Walker positions before the step.
+        xs, ys: Walker positions after the step.
+    """
+    dx = (xs - old_xs)[:, None]
+    dy = (ys - old_ys)[:, None]
+    steps = int(max(np.abs(dx).max(initial=0), np.abs(dy).max(initial=0))) + 1
+    t = np.linspace(0.0, 1.0, steps)
+    px = np.rint(old_xs[:, None] + t * dx).astype(np.intp).ravel()
+    py = np.rint(old_ys[:, None] + t * dy).astype(np.intp).ravel()
+    pc = np.repeat(colors, steps, axis=0)
+
+    # Walkers may sit on the far edge (x == WIDTH, y == HEIGHT); drop those pixels
+    width, height = surface.get_size()
+    visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    pixels = pygame.surfarray.pixels3d(surface)
+    pixels[px[visible], py[visible]] = pc[visible]
+    del pixels
+
+def build_heat_lut(size: int = 256) -> np.ndarray:
+    """Build a color lookup table for heat values 0-1 (blue -> green -> yellow -> red)."""
+    value = np.arange(size) / (size - 1)
+    t = np.select(
+        [value < 0.25, value < 0.5, value < 0.75],
+        [value / 0.25, (value - 0.25) / 0.25, (value - 0.5) / 0.25],
+        (value - 0.75) / 0.25
+    )
+    rising = (t * 255).astype(np.uint8)
+    falling = (255 * (1 - t)).astype(np.uint8)
+    full = np.full_like(rising, 255)
+    zero = np.zeros_like(rising)
+    
+    band = np.select([value < 0.25, value < 0.5, value < 0.75], [0, 1, 2], 3)
+    lut = np.empty((size, 3), dtype=np.uint8)
+    lut[:, 0] = np.choose(band, [zero, zero, rising, full])     # Blue->Cyan->Green->Yellow->Red
+    lut[:, 1] = np.choose(band, [rising, full, full, falling])
+    lut[:, 2] = np.choose(band, [full, falling, zero, zero])
+    return lut
+
+HEAT_LUT: np.ndarray = build_heat_lut()
+
+# Last rendered heatmap overlay per tracker: id(tracker) -> (heat_version, alpha, surface)
+_overlay_cache: Dict[int, Tuple[int, int, pygame.Surface]] = {}
 
 def render_heatmap(surface: pygame.Surface, tracker: StatsTracker, offset_x: int = 0, alpha: int = 100) -> None:
-    """Render heatmap overlay on surface."""
+    """Render heatmap overlay on surface, rebuilding it only when the heatmap changed."""
+    cached = _overlay_cache.get(id(tracker))
+    if cached is not None and cached[0] == tracker.heat_version and cached[1] == alpha:
+        surface.blit(cached[2], (offset_x, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        return
+    
+    counts = tracker.heatmap
     max_heat = tracker.get_max_heat()
+    cell = tracker.cell_size
+    
+    # Quantize uint16 counts to 8-bit palette indices and map to RGBA for the
+    # whole grid at once; unvisited cells stay fully transparent
+    idx = (counts.astype(np.uint32) * 255 // max_heat).astype(np.uint8)
+    rgba = np.empty(counts.shape + (4,), dtype=np.uint8)
+    rgba[..., :3] = HEAT_LUT[idx]
+    rgba[..., 3] = np.where(counts > 0, alpha, 0)
     
-    for row_idx, row in enumerate(tracker.heatmap):
-        for col_idx, count in enumerate(row):
-            if count > 0:
-                # Normalize heat value
-                heat = min(count / max_heat, 1.0) if max_heat > 0 else 0
-                color = heat_to_color(heat)
-                
-                # Draw cell
-                rect = pygame.Rect(
-                    offset_x + col_idx * tracker.cell_size,
-                    row_idx * tracker.cell_size,
-                    tracker.cell_size,
-                    tracker.cell_size
-                )
-                cell_surface = pygame.Surface((tracker.cell_size, tracker.cell_size))
-                cell_surface.fill(color)
-                cell_surface.set_alpha(alpha)
-                surface.blit(cell_surface, rect)
+    # Upscale from grid cells to pixels
+    rgba = np.repeat(np.repeat(rgba, cell, axis=0), cell, axis=1)
+    
+    overlay = pygame.image.frombuffer(rgba, (rgba.shape[1], rgba.shape[0]), 'RGBA')
+    _overlay_cache[id(tracker)] = (tracker.heat_version, alpha, overlay)
+    surface.blit(overlay, (offset_x, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+
+def make_text_renderer(font: pygame.font.Font, maxsize: int = 128) -> Callable[[str, Tuple[int, int, int]], pygame.Surface]:
+    """Wrap font.render in an LRU cache keyed by text and color."""
+    @functools.lru_cache(maxsize=maxsize)
+    def render(text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        return font.render(text, True, color)
+    return render
+
+def _report_graph_error(future: Future) -> None:
+    """Print any exception raised while generating graphs in the background."""
+    error = future.exception()
+    if error is not None:
+        print(f"Graph generation failed: {error!r}")
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="EntropyWalker : Comparative Stochastic Visualization")
+    parser.add_argument("--gpu", action="store_true",
+                        help="record statistics with the CUDA kernel (for very large swarms)")
+    return parser.parse_args()
 
 def main() -> NoReturn:
     """Main application loop."""
+    args = parse_args()
+    if args.gpu and not cuda_available():
+        print("CUDA is not available; recording statistics on the CPU")
+    
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("EntropyWalker : Comparative Stochastic Visualization")
     clock = pygame.time.Clock()
 
-    font = pygame.font.SysFont("Consolas", 14)
-    font_small = pygame.font.SysFont("Consolas", 12)
+    # Cached text rendering: HUD strings repeat across frames
+    render_text = make_text_renderer(pygame.font.SysFont("Consolas", 14))
+    render_small = make_text_renderer(pygame.font.SysFont("Consolas", 12))
     
     # Calculate screen geometry
     mid_x: int = WIDTH // 2
@@ -117,24 +217,19 @@ def main() -> NoReturn:
     left_colors = generate_color_variants(LEFT_BASE_COLOR, NUM_WALKERS)
     right_colors = generate_color_variants(RIGHT_BASE_COLOR, NUM_WALKERS)
 
-    # Initialize Walkers
-    walkers_std: List[RandomWalker] = []
-    walkers_true: List[RandomWalker] = []
-    
+    # Initialize Walkers (one array-backed swarm per side)
     left_origin = (mid_x // 2, HEIGHT // 2)
     right_origin = (mid_x + (mid_x // 2), HEIGHT // 2)
     
-    for i in range(NUM_WALKERS):
-        walkers_std.append(RandomWalker(
-            left_origin[0], left_origin[1], left_colors[i], step_size=3, max_history=5000
-        ))
-        walkers_true.append(RandomWalker(
-            right_origin[0], right_origin[1], right_colors[i], step_size=3, max_history=5000
-        ))
+    swarm_std = WalkerSwarm(left_origin[0], left_origin[1], left_colors,
+                            bounds=(0, 0, mid_x - 1, HEIGHT), step_size=STEP_SIZE)
+    swarm_true = WalkerSwarm(right_origin[0], right_origin[1], right_colors,
+                             bounds=(mid_x + 1, 0, WIDTH, HEIGHT), step_size=STEP_SIZE)
+    trail_colors = np.concatenate((swarm_std.colors, swarm_true.colors))
 
     # Initialize Stats Trackers
-    stats_std = StatsTracker(left_origin, mid_x, HEIGHT, CELL_SIZE)
-    stats_true = StatsTracker((mid_x // 2, HEIGHT // 2), mid_x, HEIGHT, CELL_SIZE)
+    stats_std = StatsTracker(left_origin, mid_x, HEIGHT, CELL_SIZE, use_gpu=args.gpu)
+    stats_true = StatsTracker((mid_x // 2, HEIGHT // 2), mid_x, HEIGHT, CELL_SIZE, use_gpu=args.gpu)
 
     # Configure TrueEntropy
     trueentropy.configure(mode="HYBRID", hybrid_reseed_interval=60.0)
@@ -145,9 +240,19 @@ def main() -> NoReturn:
     trail_surface.fill(BG_COLOR)
     pygame.draw.line(trail_surface, DIVIDER_COLOR, (mid_x, 0), (mid_x, HEIGHT), 2)
 
+    # Walker head sprite, rasterized once and blitted for every walker each frame
+    head_sprite = pygame.Surface((2 * HEAD_RADIUS + 1, 2 * HEAD_RADIUS + 1), pygame.SRCALPHA)
+    pygame.draw.circle(head_sprite, WHITE, (HEAD_RADIUS, HEAD_RADIUS), HEAD_RADIUS)
+
+    # HUD text surfaces and positions, rebuilt periodically and blitted every frame
+    hud_items: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
     # State
     running: bool = True
     show_heatmap: bool = False
+    graph_future: Optional[Future] = None
+    frame_count: int = 0
+    hud_dirty: bool = True
 
     try:
         while running:
@@ -163,35 +268,43 @@ def main() -> NoReturn:
                         pygame.draw.line(trail_surface, DIVIDER_COLOR, (mid_x, 0), (mid_x, HEIGHT), 2)
                     elif event.key == pygame.K_h:
                         show_heatmap = not show_heatmap
+                        hud_dirty = True
                     elif event.key == pygame.K_r:
                         stats_std.reset()
                         stats_true.reset()
+                        hud_dirty = True
                     elif event.key == pygame.K_g:
-                        # Show distribution graphs
-                        show_distribution_graphs(
-                            stats_std, stats_true,
-                            "Python Random", ENTROPY_SOURCE_NAME
-                        )
-
-            # Update walkers and record stats
-            for walker in walkers_std:
-                old_x, old_y = walker.x, walker.y
-                direction = get_random_direction_std()
-                walker.move(direction)
-                walker.x = max(0, min(walker.x, mid_x - 1))
-                walker.y = max(0, min(walker.y, HEIGHT))
-                pygame.draw.line(trail_surface, walker.color, (old_x, old_y), (walker.x, walker.y), 1)
-                stats_std.record_move(walker.x, walker.y, direction)
-
-            for walker in walkers_true:
-                old_x, old_y = walker.x, walker.y
-                direction = get_random_direction_true()
-                walker.move(direction)
-                walker.x = max(mid_x + 1, min(walker.x, WIDTH))
-                walker.y = max(0, min(walker.y, HEIGHT))
-                pygame.draw.line(trail_surface, walker.color, (old_x, old_y), (walker.x, walker.y), 1)
-                # Adjust x for right-side heatmap (relative to mid_x)
-                stats_true.record_move(walker.x - mid_x, walker.y, direction)
+                        # Show distribution graphs from a snapshot, rendered off the main
+                        # thread; ignore the key while a previous render is in flight
+                        if graph_future is None or graph_future.done():
+                            graph_future = _graph_executor.submit(
+                                show_distribution_graphs,
+                                copy.deepcopy(stats_std), copy.deepcopy(stats_true),
+                                STD_SOURCE_NAME, ENTROPY_SOURCE_NAME
+                            )
+                            graph_future.add_done_callback(_report_graph_error)
+
+            # Update walkers (one bulk RNG draw per side), then draw and record stats
+            left_args = (swarm_std, get_random_directions_std)
+            right_args = (swarm_true, get_random_directions_true)
+            if NUM_WALKERS >= PARALLEL_UPDATE_MIN_WALKERS:
+                left_future = _update_pool.submit(update_side, *left_args)
+                right_future = _update_pool.submit(update_side, *right_args)
+                old_xs_std, old_ys_std, dirs_std = left_future.result()
+                old_xs_true, old_ys_true, dirs_true = right_future.result()
+            else:
+                old_xs_std, old_ys_std, dirs_std = update_side(*left_args)
+                old_xs_true, old_ys_true, dirs_true = update_side(*right_args)
+
+            all_xs = np.concatenate((swarm_std.xs, swarm_true.xs))
+            all_ys = np.concatenate((swarm_std.ys, swarm_true.ys))
+            draw_trail_segments(trail_surface, trail_colors,
+                                np.concatenate((old_xs_std, old_xs_true)), np.concatenate((old_ys_std, old_ys_true)),
+                                all_xs, all_ys)
+
+            stats_std.record_moves(swarm_std.xs, swarm_std.ys, dirs_std)
+            # Adjust x for right-side heatmap (relative to mid_x)
+            stats_true.record_moves(swarm_true.xs - mid_x, swarm_true.ys, dirs_true)
 
             # Drawing
             screen.blit(trail_surface, (0, 0))
@@ -202,46 +315,48 @@ def main() -> NoReturn:
                 render_heatmap(screen, stats_true, mid_x, 80)
 
             # Draw Walker Heads
-            for walker in walkers_std:
-                pygame.draw.circle(screen, WHITE, (walker.x, walker.y), 2)
-            for walker in walkers_true:
-                pygame.draw.circle(screen, WHITE, (walker.x, walker.y), 2)
-
-            # UI / HUD - Top
-            text_std = font.render(f"Python random (Mersenne Twister) x{NUM_WALKERS}", True, LEFT_BASE_COLOR)
-            screen.blit(text_std, (20, 15))
-
-            text_true = font.render(f"{ENTROPY_SOURCE_NAME} x{NUM_WALKERS}", True, RIGHT_BASE_COLOR)
-            screen.blit(text_true, (mid_x + 20, 15))
-
-            # Stats Panel - Left
-            left_stats = stats_std.get_stats_dict()
-            stats_y = HEIGHT - 80
-            screen.blit(font_small.render(f"Dispersão: {left_stats['dispersao']:.1f}px", True, TEXT_COLOR), (20, stats_y))
-            screen.blit(font_small.render(f"Retorno: {left_stats['retorno_rate']:.2f}%", True, TEXT_COLOR), (20, stats_y + 15))
-            screen.blit(font_small.render(f"Entropia: {left_stats['entropia']:.3f}/2.0", True, TEXT_COLOR), (20, stats_y + 30))
-            screen.blit(font_small.render(f"Moves: {left_stats['total_moves']}", True, TEXT_COLOR), (20, stats_y + 45))
-
-            # Stats Panel - Right
-            right_stats = stats_true.get_stats_dict()
-            screen.blit(font_small.render(f"Dispersão: {right_stats['dispersao']:.1f}px", True, TEXT_COLOR), (mid_x + 20, stats_y))
-            screen.blit(font_small.render(f"Retorno: {right_stats['retorno_rate']:.2f}%", True, TEXT_COLOR), (mid_x + 20, stats_y + 15))
-            screen.blit(font_small.render(f"Entropia: {right_stats['entropia']:.3f}/2.0", True, TEXT_COLOR), (mid_x + 20, stats_y + 30))
-            screen.blit(font_small.render(f"Moves: {right_stats['total_moves']}", True, TEXT_COLOR), (mid_x + 20, stats_y + 45))
-
-            # Health indicator
-            health = trueentropy.health()
-            health_text = font_small.render(f"Health: {health['score']}/100", True, TEXT_COLOR)
-            screen.blit(health_text, (WIDTH - 150, HEIGHT - 25))
-
-            # Heatmap toggle indicator
-            heatmap_text = font_small.render(f"[H] Heatmap: {'ON' if show_heatmap else 'OFF'}", True, TEXT_COLOR)
-            screen.blit(heatmap_text, (WIDTH // 2 - 60, HEIGHT - 25))
+            head_xs = all_xs - HEAD_RADIUS
+            head_ys = all_ys - HEAD_RADIUS
+            screen.blits([(head_sprite, pos) for pos in zip(head_xs.tolist(), head_ys.tolist())],
+                         doreturn=False)
+
+            # UI / HUD (text rebuilt every HUD_REFRESH_FRAMES frames, blitted every frame)
+            if hud_dirty or frame_count % HUD_REFRESH_FRAMES == 0:
+                # Top
+                text_std = render_text(f"{STD_SOURCE_NAME} x{NUM_WALKERS}", LEFT_BASE_COLOR)
+                text_true = render_text(f"{ENTROPY_SOURCE_NAME} x{NUM_WALKERS}", RIGHT_BASE_COLOR)
+                hud_items = [(text_std, (20, 15)), (text_true, (mid_x + 20, 15))]
+
+                # Stats Panels - Left and Right
+                stats_y = HEIGHT - 80
+                for tracker, panel_x in ((stats_std, 20), (stats_true, mid_x + 20)):
+                    panel_stats = tracker.get_stats_dict()
+                    hud_items += [
+                        (render_small(f"Dispersão: {panel_stats['dispersao']:.1f}px", TEXT_COLOR), (panel_x, stats_y)),
+                        (render_small(f"Retorno: {panel_stats['retorno_rate']:.2f}%", TEXT_COLOR), (panel_x, stats_y + 15)),
+                        (render_small(f"Entropia: {panel_stats['entropia']:.3f}/2.0", TEXT_COLOR), (panel_x, stats_y + 30)),
+                        (render_small(f"Moves: {panel_stats['total_moves']}", TEXT_COLOR), (panel_x, stats_y + 45)),
+                    ]
+
+                # Health indicator
+                health = trueentropy.health()
+                health_text = render_small(f"Health: {health['score']}/100", TEXT_COLOR)
+                hud_items.append((health_text, (WIDTH - 150, HEIGHT - 25)))
+
+                # Heatmap toggle indicator
+                heatmap_text = render_small(f"[H] Heatmap: {'ON' if show_heatmap else 'OFF'}", TEXT_COLOR)
+                hud_items.append((heatmap_text, (WIDTH // 2 - 60, HEIGHT - 25)))
+
+                hud_dirty = False
+            screen.blits(hud_items, doreturn=False)
 
             pygame.display.flip()
+            frame_count += 1
             clock.tick(FPS)
     finally:
         trueentropy.stop_collector()
+        _graph_executor.shutdown(wait=False)
+        _update_pool.shutdown(wait=False)
 
     pygame.quit()
     sys.exit()
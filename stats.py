@@ -15,8 +15,342 @@ Metrics tracked:
 """
 
 import math
-from typing import Tuple, List, Dict
-from collections import Counter
+from typing import Tuple, Dict
+
+import numpy as np
+
+from directions import DIRECTION_INDEX, DIRECTION_NAMES
+
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels run as plain Python/NumPy
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    def get_num_threads() -> int:
+        return 1
+
+try:
+    from fast_histogram import histogram2d
+    FAST_HISTOGRAM_AVAILABLE = True
+except ImportError:  # fast-histogram is optional; falls back to np.bincount
+    FAST_HISTOGRAM_AVAILABLE = False
+
+# numba.cuda and the CUDA kernel, loaded by cuda_available() on first use
+cuda = None
+_record_batch_cuda = None
+_cuda_probed = False
+
+
+# Heatmap cells are uint16 and saturate at this count instead of wrapping
+HEAT_MAX = 65535
+
+# Width in pixels of each bucket in the windowed distance distribution
+DISTANCE_BUCKET_SIZE = 10
+
+# Threads per block for the CUDA record kernel
+CUDA_THREADS_PER_BLOCK = 256
+
+# Batches at least this large are split across threads, each with its own heatmap slab
+PARALLEL_RECORD_MIN_MOVES = 50_000
+
+
+def _ring_push(ring: np.ndarray, idx: int, count: int, values: np.ndarray) -> Tuple[int, int, np.ndarray]:
+    """
+    Append values to a ring buffer, overwriting the oldest entries once full.
+    
+    Args:
+        ring: Fixed-size buffer, modified in place.
+        idx: Next write position.
+        count: Number of valid entries currently stored.
+        values: New entries, oldest first.
+    
+    Returns:
+        Tuple of (new write position, new valid count, evicted entries).
+    """
+    size = len(ring)
+    n = len(values)
+    recent = values[-size:]
+    slots = (idx + n - len(recent) + np.arange(len(recent))) % size
+    if n >= size:
+        evicted = np.concatenate((ring[:count], values[:n - size]))
+    else:
+        evicted = ring[slots[size - count:]]
+    ring[slots] = recent
+    return (idx + n) % size, min(count + n, size), evicted
+
+
+@njit(cache=True)
+def _record_one(heatmap: np.ndarray, dir_counts: np.ndarray, dir_ring: np.ndarray,
+                window_counts: np.ndarray, dist_ring: np.ndarray, dist_hist: np.ndarray,
+                dir_idx: int, dir_count: int, dist_idx: int, dist_count: int,
+                x: int, y: int, d: int, cell_size: int, ox: float, oy: float
+                ) -> Tuple[int, int, int, int, int, float, float]:
+    """
+    Record one move into every array-backed statistic in a single call.
+    
+    Increments (saturating) the heatmap cell containing (x, y) and the
+    direction count (skipped when d is -1, an unknown direction, which the
+    entropy window records as UP), pushes d onto the direction ring and the distance
+    from (ox, oy) onto the distance ring, and keeps the window counts and
+    distance buckets in sync with evicted entries. Compiled when numba is
+    installed, plain Python otherwise.
+    
+    Returns:
+        Tuple of (dir_idx, dir_count, dist_idx, dist_count, new cell count,
+        squared distance, distance).
+    """
+    grid_height, grid_width = heatmap.shape
+    # Conditional clamp: no min()/max() calls when running as plain Python
+    cell_x = 0 if x < 0 else (grid_width - 1 if x >= grid_width * cell_size else x // cell_size)
+    cell_y = 0 if y < 0 else (grid_height - 1 if y >= grid_height * cell_size else y // cell_size)
+    if heatmap[cell_y, cell_x] < HEAT_MAX:
+        heatmap[cell_y, cell_x] += 1
+    if d >= 0:
+        dir_counts[d] += 1
+    else:
+        d = 0  # Unknown direction: left out of the counts, recorded as UP for entropy
+    
+    # Direction window for entropy
+    dir_size = len(dir_ring)
+    if dir_count == dir_size:
+        window_counts[dir_ring[dir_idx]] -= 1
+    else:
+        dir_count += 1
+    dir_ring[dir_idx] = d
+    window_counts[d] += 1
+    
+    # Distance window and its buckets (bucketed from the stored float32 value)
+    dx = x - ox
+    dy = y - oy
+    dist_sq = dx * dx + dy * dy
+    dist = math.sqrt(dist_sq)
+    dist_size = len(dist_ring)
+    last_bucket = len(dist_hist) - 1
+    if dist_count == dist_size:
+        dist_hist[min(int(dist_ring[dist_idx] // DISTANCE_BUCKET_SIZE), last_bucket)] -= 1
+    else:
+        dist_count += 1
+    dist_ring[dist_idx] = dist
+    dist_hist[min(int(dist_ring[dist_idx] // DISTANCE_BUCKET_SIZE), last_bucket)] += 1
+    
+    return ((dir_idx + 1) % dir_size, dir_count, (dist_idx + 1) % dist_size, dist_count,
+            int(heatmap[cell_y, cell_x]), dist_sq, dist)
+
+
+@njit(cache=True, fastmath=True)
+def _record_batch(xs: np.ndarray, ys: np.ndarray, dirs: np.ndarray, heatmap: np.ndarray,
+                  dir_counts: np.ndarray, dir_ring: np.ndarray, window_counts: np.ndarray,
+                  dist_ring: np.ndarray, dist_hist: np.ndarray, dir_idx: int, dir_count: int,
+                  dist_idx: int, dist_count: int, ox: float, oy: float, cell_size: int,
+                  thr2: float, max_heat: int) -> Tuple[int, int, int, int, int, float, int]:
+    """
+    Compiled fused pass over a batch of moves (used when numba is installed).
+    
+    Each (x, y, dir) is read once and applied to every statistic in the same
+    loop body: heatmap cell and max_heat, direction count, direction ring
+    and window counts, distance ring and buckets, return check and distance
+    sum. Equivalent to _record_one per move, without per-move call overhead.
+    
+    Returns:
+        Tuple of (dir_idx, dir_count, dist_idx, dist_count, max_heat,
+        sum of distances, moves within the squared return threshold thr2).
+    """
+    grid_height, grid_width = heatmap.shape
+    dir_size = len(dir_ring)
+    dist_size = len(dist_ring)
+    last_bucket = len(dist_hist) - 1
+    dist_sum = 0.0
+    returns = 0
+    for i in range(len(dirs)):
+        x = xs[i]
+        y = ys[i]
+        d = dirs[i]
+        
+        cell_x = max(0, min(x // cell_size, grid_width - 1))
+        cell_y = max(0, min(y // cell_size, grid_height - 1))
+        heat = heatmap[cell_y, cell_x]
+        if heat < HEAT_MAX:
+            heat += 1
+            heatmap[cell_y, cell_x] = heat
+        if heat > max_heat:
+            max_heat = heat
+        dir_counts[d] += 1
+        
+        if dir_count == dir_size:
+            window_counts[dir_ring[dir_idx]] -= 1
+        else:
+            dir_count += 1
+        dir_ring[dir_idx] = d
+        window_counts[d] += 1
+        dir_idx += 1
+        if dir_idx == dir_size:
+            dir_idx = 0
+        
+        dx = x - ox
+        dy = y - oy
+        dist_sq = dx * dx + dy * dy
+        if dist_sq <= thr2:
+            returns += 1
+        dist = math.sqrt(dist_sq)
+        dist_sum += dist
+        
+        # Distances are non-negative, so int() // bucket equals floor division
+        if dist_count == dist_size:
+            dist_hist[min(int(dist_ring[dist_idx]) // DISTANCE_BUCKET_SIZE, last_bucket)] -= 1
+        else:
+            dist_count += 1
+        stored = np.float32(dist)
+        dist_ring[dist_idx] = stored
+        dist_hist[min(int(stored) // DISTANCE_BUCKET_SIZE, last_bucket)] += 1
+        dist_idx += 1
+        if dist_idx == dist_size:
+            dist_idx = 0
+    return dir_idx, dir_count, dist_idx, dist_count, max_heat, dist_sum, returns
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _record_batch_parallel(xs: np.ndarray, ys: np.ndarray, dirs: np.ndarray, heatmap: np.ndarray,
+                           dir_counts: np.ndarray, distances: np.ndarray, ox: float, oy: float,
+                           cell_size: int, thr2: float, max_heat: int,
+                           num_chunks: int) -> Tuple[float, int, int]:
+    """
+    Parallel heatmap/count/distance pass for very large batches.
+    
+    Ring buffers are inherently sequential, so they are filled afterwards
+    from the distances written here. The batch is split into num_chunks
+    contiguous chunks. Each chunk accumulates into its own heatmap slab and
+    counter row, so workers never write to shared cells; the slabs are
+    summed into heatmap afterwards.
+    """
+    grid_height, grid_width = heatmap.shape
+    n = len(dirs)
+    local_heatmaps = np.zeros((num_chunks, grid_height, grid_width), dtype=np.int32)
+    local_counts = np.zeros((num_chunks, 4), dtype=np.int64)
+    local_sums = np.zeros(num_chunks, dtype=np.float64)
+    local_returns = np.zeros(num_chunks, dtype=np.int64)
+    chunk = (n + num_chunks - 1) // num_chunks
+    
+    for c in prange(num_chunks):
+        slab = local_heatmaps[c]
+        counts = local_counts[c]
+        dist_sum = 0.0
+        returns = 0
+        for i in range(c * chunk, min((c + 1) * chunk, n)):
+            x = xs[i]
+            y = ys[i]
+            cell_x = max(0, min(x // cell_size, grid_width - 1))
+            cell_y = max(0, min(y // cell_size, grid_height - 1))
+            slab[cell_y, cell_x] += 1
+            counts[dirs[i]] += 1
+            
+            dx = x - ox
+            dy = y - oy
+            dist_sq = dx * dx + dy * dy
+            if dist_sq <= thr2:
+                returns += 1
+            dist = math.sqrt(dist_sq)
+            distances[i] = dist
+            dist_sum += dist
+        local_sums[c] = dist_sum
+        local_returns[c] = returns
+    
+    # Reduce the per-chunk slabs and counters into the shared state
+    totals = local_heatmaps.sum(axis=0)
+    for cy in range(grid_height):
+        for cx in range(grid_width):
+            if totals[cy, cx] > 0:
+                value = min(heatmap[cy, cx] + totals[cy, cx], HEAT_MAX)
+                heatmap[cy, cx] = value
+                max_heat = max(max_heat, value)
+    for c in range(num_chunks):
+        for d in range(4):
+            dir_counts[d] += local_counts[c, d]
+    return local_sums.sum(), int(local_returns.sum()), max_heat
+
+
+def _build_cuda_kernel():
+    """Define the CUDA record kernel (only called once numba.cuda is loaded as `cuda`)."""
+    @cuda.jit
+    def record_batch_cuda(xs, ys, dirs, added, dir_counts, distances, ox, oy, cell_size):
+        """Device kernel: one thread per move, heatmap and direction counts via atomics."""
+        i = cuda.grid(1)
+        if i >= dirs.shape[0]:
+            return
+        grid_height, grid_width = added.shape
+        x = xs[i]
+        y = ys[i]
+        cell_x = max(0, min(x // cell_size, grid_width - 1))
+        cell_y = max(0, min(y // cell_size, grid_height - 1))
+        cuda.atomic.add(added, (cell_y, cell_x), 1)
+        cuda.atomic.add(dir_counts, dirs[i], 1)
+        dx = x - ox
+        dy = y - oy
+        distances[i] = math.sqrt(dx * dx + dy * dy)
+    
+    return record_batch_cuda
+
+
+def cuda_available() -> bool:
+    """
+    Check for a usable CUDA device, loading numba.cuda and the kernel on first call.
+    
+    Importing numba.cuda and probing for a driver is slow, so it only
+    happens when the GPU path is requested; the answer is cached.
+    
+    Returns:
+        True if the CUDA record path can be used.
+    """
+    global cuda, _record_batch_cuda, _cuda_probed
+    if not _cuda_probed:
+        _cuda_probed = True
+        if NUMBA_AVAILABLE:
+            try:
+                from numba import cuda as numba_cuda
+                if numba_cuda.is_available():
+                    cuda = numba_cuda
+                    _record_batch_cuda = _build_cuda_kernel()
+            except Exception:  # CUDA support is optional; no toolkit or driver present
+                cuda = None
+    return cuda is not None
+
+
+def _record_batch_gpu(xs: np.ndarray, ys: np.ndarray, dirs: np.ndarray, grid_shape: Tuple[int, int],
+                      ox: float, oy: float, cell_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the heatmap/direction/distance pass for a batch on the GPU (requires cuda_available()).
+    
+    Atomic int32 counts are accumulated into a fresh device grid rather than
+    the uint16 heatmap itself (CUDA has no 16-bit atomics), so saturation is
+    applied on the host when merging.
+    
+    Returns:
+        Tuple of (per-cell visit counts, per-direction counts, distances from (ox, oy)).
+    """
+    n = len(dirs)
+    added = cuda.to_device(np.zeros(grid_shape, dtype=np.int32))
+    dir_counts = cuda.to_device(np.zeros(len(DIRECTION_NAMES), dtype=np.int64))
+    distances = cuda.device_array(n, dtype=np.float64)
+    blocks = (n + CUDA_THREADS_PER_BLOCK - 1) // CUDA_THREADS_PER_BLOCK
+    _record_batch_cuda[blocks, CUDA_THREADS_PER_BLOCK](
+        cuda.to_device(xs), cuda.to_device(ys), cuda.to_device(dirs),
+        added, dir_counts, distances, ox, oy, cell_size)
+    return added.copy_to_host(), dir_counts.copy_to_host(), distances.copy_to_host()
+
+
+@njit(cache=True)
+def _shannon_entropy(counts: np.ndarray) -> float:
+    """Shannon entropy (bits) of a histogram of counts."""
+    p = counts / counts.sum()
+    p = p[p > 0]
+    return (p * np.log2(1.0 / p)).sum()
 
 
 class StatsTracker:
@@ -32,12 +366,24 @@ class StatsTracker:
         cell_size: Size of each heatmap cell in pixels.
         grid_width: Number of horizontal cells in heatmap.
         grid_height: Number of vertical cells in heatmap.
-        heatmap: 2D grid storing visit counts per cell.
-        direction_counts: Counter for each direction.
+        heatmap: 2D uint16 array (rows x cols) storing visit counts per cell,
+            saturating at HEAT_MAX.
+        direction_counts: int64 array of move counts, indexed 0=UP, 1=DOWN, 2=LEFT, 3=RIGHT.
         total_moves: Total number of recorded moves.
+        heat_version: Counter bumped whenever the heatmap changes, for render caching.
     """
 
-    def __init__(self, origin: Tuple[int, int], width: int, height: int, cell_size: int = 10):
+    __slots__ = (
+        'origin', '_ox', '_oy', 'cell_size', 'grid_width', 'grid_height',
+        'heatmap', 'heat_version', '_max_heat',
+        'max_history', '_dir_ring', '_dir_idx', '_dir_count', '_window_counts', 'direction_counts',
+        'max_distance_history', '_dist_ring', '_dist_idx', '_dist_count', '_num_dist_buckets', '_dist_hist',
+        'return_count', 'return_threshold', '_thr2',
+        'total_moves', 'distance_sum', '_stats_cache', '_stats_dirty', 'use_gpu',
+    )
+
+    def __init__(self, origin: Tuple[int, int], width: int, height: int, cell_size: int = 10,
+                 use_gpu: bool = False):
         """
         Initialize the statistics tracker.
         
@@ -46,36 +392,57 @@ class StatsTracker:
             width: Total tracking width in pixels.
             height: Total tracking height in pixels.
             cell_size: Size of each heatmap cell in pixels.
+            use_gpu: Record batches with the CUDA kernel; ignored if CUDA is unavailable.
         """
+        self.use_gpu = use_gpu and cuda_available()
         self.origin = origin
+        self._ox, self._oy = float(origin[0]), float(origin[1])
         self.cell_size = cell_size
         self.grid_width = width // cell_size
         self.grid_height = height // cell_size
         
         # Heatmap: 2D grid storing visit count per cell
-        self.heatmap: List[List[int]] = [[0] * self.grid_width for _ in range(self.grid_height)]
+        self.heatmap: np.ndarray = np.zeros((self.grid_height, self.grid_width), dtype=np.uint16)
+        self.heat_version: int = 0
+        self._max_heat: int = 0  # Streaming max of heatmap, updated on every increment
         
         # Direction tracking for entropy calculation
         # Stored as integers: 0=UP, 1=DOWN, 2=LEFT, 3=RIGHT
-        self.direction_history: List[int] = []
+        # (fixed-size ring buffer, see the direction_history property)
         self.max_history = 1000  # Rolling window for entropy
+        self._dir_ring: np.ndarray = np.zeros(self.max_history, dtype=np.uint8)
+        self._dir_idx: int = 0
+        self._dir_count: int = 0
+        # Per-direction counts over the rolling window, kept in sync on push/evict
+        self._window_counts: np.ndarray = np.zeros(len(DIRECTION_NAMES), dtype=np.int64)
         
-        # Direction counts for histogram visualization
-        self.direction_counts: Dict[str, int] = {'UP': 0, 'DOWN': 0, 'LEFT': 0, 'RIGHT': 0}
+        # Direction counts for histogram visualization (same order as DIRECTION_NAMES)
+        self.direction_counts: np.ndarray = np.zeros(len(DIRECTION_NAMES), dtype=np.int64)
         
-        # Distance history for distribution graphs
-        self.distance_history: List[float] = []
+        # Distance history for distribution graphs (fixed-size ring buffer)
         self.max_distance_history = 500
+        self._dist_ring: np.ndarray = np.zeros(self.max_distance_history, dtype=np.float32)
+        self._dist_idx: int = 0
+        self._dist_count: int = 0
+        # Bucketed counts of the distances in the ring, kept in sync on push/evict
+        self._num_dist_buckets = int(math.hypot(width, height)) // DISTANCE_BUCKET_SIZE + 1
+        self._dist_hist: np.ndarray = np.zeros(self._num_dist_buckets, dtype=np.int32)
         
         # Return to origin tracking
         self.return_count: int = 0
         self.return_threshold: int = 15  # Pixels within origin to count as "returned"
+        self._thr2: float = float(self.return_threshold) ** 2
         
         # Aggregate statistics
         self.total_moves: int = 0
         self.distance_sum: float = 0.0
+        
+        # Memoized get_stats_dict() result, invalidated by record_move/reset
+        self._stats_cache: Dict[str, float] = {}
+        self._stats_dirty: bool = True
 
-    def record_move(self, x: int, y: int, direction: str) -> None:
+    def record_move(self, x: int, y: int, direction: str,
+                    _record=_record_one, _dir_index=DIRECTION_INDEX.get) -> None:
         """
         Record a single walker move for statistical analysis.
         
@@ -83,38 +450,169 @@ class StatsTracker:
             x: New x-coordinate after move.
             y: New y-coordinate after move.
             direction: Direction taken ('UP', 'DOWN', 'LEFT', 'RIGHT').
+            _record, _dir_index: Hot-path globals bound at definition time
+                so each call skips the global/attribute lookups; not for callers.
         """
         self.total_moves += 1
+        self.heat_version += 1
+        self._stats_dirty = True
         
-        # Update heatmap cell (clamp to grid bounds)
-        cell_x = max(0, min(x // self.cell_size, self.grid_width - 1))
-        cell_y = max(0, min(y // self.cell_size, self.grid_height - 1))
-        self.heatmap[cell_y][cell_x] += 1
+        # Heatmap, direction and distance windows in one (compiled) call
+        (self._dir_idx, self._dir_count, self._dist_idx, self._dist_count,
+         heat, dist_sq, dist_to_origin) = _record(
+            self.heatmap, self.direction_counts, self._dir_ring, self._window_counts,
+            self._dist_ring, self._dist_hist, self._dir_idx, self._dir_count,
+            self._dist_idx, self._dist_count, x, y, _dir_index(direction, -1),
+            self.cell_size, self._ox, self._oy)
+        if heat > self._max_heat:
+            self._max_heat = heat
         
-        # Record direction for entropy calculation
-        dir_map = {'UP': 0, 'DOWN': 1, 'LEFT': 2, 'RIGHT': 3}
-        self.direction_history.append(dir_map.get(direction, 0))
-        if len(self.direction_history) > self.max_history:
-            self.direction_history.pop(0)
+        # Check if walker returned to origin area (squared distance, no sqrt needed)
+        if dist_sq <= self._thr2:
+            self.return_count += 1
+        
+        # Accumulate for average distance calculation
+        self.distance_sum += dist_to_origin
+
+    def record_moves(self, xs: np.ndarray, ys: np.ndarray, dirs: np.ndarray) -> None:
+        """
+        Record one batch of walker moves (e.g. a whole frame) for statistical analysis.
+        
+        Equivalent to calling record_move for each (x, y, direction) in order,
+        but updates every statistic per batch: in one fused compiled loop when
+        numba is installed, otherwise with a few vectorized NumPy operations.
+        
+        Args:
+            xs: New x-coordinates after the moves.
+            ys: New y-coordinates after the moves.
+            dirs: Direction indices taken (0=UP, 1=DOWN, 2=LEFT, 3=RIGHT).
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        dirs = np.asarray(dirs, dtype=np.intp)
+        count = len(dirs)
+        if count == 0:
+            return
+        
+        self.total_moves += count
+        self.heat_version += 1
+        self._stats_dirty = True
+        
+        num_chunks = get_num_threads()
+        parallel = count >= PARALLEL_RECORD_MIN_MOVES and num_chunks > 1
+        if NUMBA_AVAILABLE and not parallel and not self.use_gpu:
+            # Every statistic, ring buffers included, in one fused compiled loop
+            (self._dir_idx, self._dir_count, self._dist_idx, self._dist_count,
+             self._max_heat, dist_sum, returns) = _record_batch(
+                xs, ys, dirs, self.heatmap, self.direction_counts, self._dir_ring,
+                self._window_counts, self._dist_ring, self._dist_hist, self._dir_idx,
+                self._dir_count, self._dist_idx, self._dist_count, self._ox, self._oy,
+                self.cell_size, self._thr2, self._max_heat)
+            self.return_count += returns
+            self.distance_sum += dist_sum
+            return
+        
+        if self.use_gpu:
+            # Heatmap and direction counts via device atomics, distances copied back
+            added, batch_counts, dist_to_origin = _record_batch_gpu(
+                xs, ys, dirs, self.heatmap.shape, self._ox, self._oy, self.cell_size)
+            self._add_heat(added)
+            dist_sum = float(dist_to_origin.sum())
+            returns = int(np.count_nonzero(dist_to_origin <= self.return_threshold))
+        elif NUMBA_AVAILABLE:
+            # Heatmap, direction counts and distances split across threads
+            batch_counts = np.zeros(len(DIRECTION_NAMES), dtype=np.int64)
+            dist_to_origin = np.empty(count, dtype=np.float64)
+            dist_sum, returns, self._max_heat = _record_batch_parallel(
+                xs, ys, dirs, self.heatmap, batch_counts, dist_to_origin,
+                self._ox, self._oy, self.cell_size, self._thr2, self._max_heat, num_chunks)
+        else:
+            batch_counts = np.bincount(dirs, minlength=len(DIRECTION_NAMES))
+            
+            # Update heatmap cells (clamped to grid bounds) with one histogram pass
+            cell_x = np.clip(xs // self.cell_size, 0, self.grid_width - 1)
+            cell_y = np.clip(ys // self.cell_size, 0, self.grid_height - 1)
+            if FAST_HISTOGRAM_AVAILABLE:
+                # Uniform unit bins over cell indices, (rows, cols) = (y, x)
+                added = histogram2d(cell_y, cell_x, bins=self.heatmap.shape,
+                                    range=[[0, self.grid_height], [0, self.grid_width]]).astype(np.int64)
+            else:
+                cell_idx = cell_y * self.grid_width + cell_x
+                added = np.bincount(cell_idx, minlength=self.heatmap.size).reshape(self.heatmap.shape)
+            self._add_heat(added)
+            
+            # Calculate Euclidean distances from origin
+            dist_to_origin = np.hypot(xs - self._ox, ys - self._oy)
+            dist_sum = float(dist_to_origin.sum())
+            returns = int(np.count_nonzero(dist_to_origin <= self.return_threshold))
         
         # Count directions for histogram
-        if direction in self.direction_counts:
-            self.direction_counts[direction] += 1
+        self.direction_counts += batch_counts
         
-        # Calculate Euclidean distance from origin
-        dist_to_origin = math.sqrt((x - self.origin[0])**2 + (y - self.origin[1])**2)
+        # Record directions for entropy calculation, evicting the oldest beyond the window
+        self._dir_idx, self._dir_count, evicted = _ring_push(
+            self._dir_ring, self._dir_idx, self._dir_count, dirs)
+        self._window_counts += batch_counts
+        self._window_counts -= np.bincount(evicted, minlength=len(DIRECTION_NAMES))
         
-        # Record distance for distribution graph
-        self.distance_history.append(dist_to_origin)
-        if len(self.distance_history) > self.max_distance_history:
-            self.distance_history.pop(0)
+        # Record distances for distribution graph (overwrites the oldest once full)
+        # and update the bucket counts for pushed and evicted entries
+        dist32 = dist_to_origin.astype(np.float32)
+        self._dist_idx, self._dist_count, evicted = _ring_push(
+            self._dist_ring, self._dist_idx, self._dist_count, dist32)
+        self._dist_hist += self._bucket_counts(dist32)
+        self._dist_hist -= self._bucket_counts(evicted)
         
-        # Check if walker returned to origin area
-        if dist_to_origin <= self.return_threshold:
-            self.return_count += 1
+        # Count walkers within the origin area and accumulate for average distance
+        self.return_count += returns
+        self.distance_sum += float(dist_sum)
+
+    def _add_heat(self, added: np.ndarray) -> None:
+        """Add per-cell visit counts to the heatmap (saturating) and update the running max."""
+        self.heatmap[...] = np.minimum(self.heatmap + added, HEAT_MAX)
+        self._max_heat = max(self._max_heat, int(self.heatmap[added > 0].max()))
+
+    def _bucket_counts(self, distances: np.ndarray) -> np.ndarray:
+        """Count distances per DISTANCE_BUCKET_SIZE bucket (last bucket is open-ended)."""
+        buckets = np.minimum(distances // DISTANCE_BUCKET_SIZE, self._num_dist_buckets - 1).astype(np.intp)
+        return np.bincount(buckets, minlength=self._num_dist_buckets).astype(np.int32)
+
+    @property
+    def direction_history(self) -> np.ndarray:
+        """
+        Most recent direction indices (0=UP, 1=DOWN, 2=LEFT, 3=RIGHT), oldest first.
         
-        # Accumulate for average distance calculation
-        self.distance_sum += dist_to_origin
+        Returns:
+            uint8 array of up to max_history directions.
+        """
+        if self._dir_count < self.max_history:
+            return self._dir_ring[:self._dir_count]
+        return np.concatenate((self._dir_ring[self._dir_idx:], self._dir_ring[:self._dir_idx]))
+
+    @property
+    def distance_history(self) -> np.ndarray:
+        """
+        Most recent distances from origin, oldest first.
+        
+        Returns:
+            float32 array of up to max_distance_history distances.
+        """
+        if self._dist_count < self.max_distance_history:
+            return self._dist_ring[:self._dist_count]
+        return np.concatenate((self._dist_ring[self._dist_idx:], self._dist_ring[:self._dist_idx]))
+
+    def get_distance_distribution(self) -> np.ndarray:
+        """
+        Get the bucketed distribution of the windowed distances from origin.
+        
+        Bucket i counts distances in [i * DISTANCE_BUCKET_SIZE, (i + 1) * DISTANCE_BUCKET_SIZE);
+        the last bucket also holds everything beyond. Maintained incrementally,
+        so this is O(1); the returned array is live and must not be modified.
+        
+        Returns:
+            int32 array of counts summing to len(distance_history).
+        """
+        return self._dist_hist
 
     def get_dispersao(self) -> float:
         """
@@ -148,36 +646,44 @@ class StatsTracker:
         For 4 equally-likely directions, maximum entropy is log2(4) = 2.0.
         Higher entropy indicates better randomness.
         
+        Uses the windowed direction counts maintained by record_move, so
+        the cost is independent of the window length.
+        
         Returns:
             Shannon entropy value (0.0 to 2.0).
         """
-        if len(self.direction_history) < 10:
+        if self._dir_count < 10:
             return 0.0
         
-        counts = Counter(self.direction_history)
-        total = len(self.direction_history)
+        return float(_shannon_entropy(self._window_counts))
+
+    def get_direction_percentages(self) -> Tuple[float, float, float, float]:
+        """
+        Calculate direction distribution as percentages, without building a dict.
         
-        entropy = 0.0
-        for count in counts.values():
-            if count > 0:
-                p = count / total
-                entropy -= p * math.log2(p)
+        Ideal distribution for unbiased RNG: 25% each direction.
         
-        return entropy
+        Returns:
+            Percentages ordered as DIRECTION_NAMES (UP, DOWN, LEFT, RIGHT).
+        """
+        c = self.direction_counts
+        total = int(c[0] + c[1] + c[2] + c[3])
+        if total == 0:
+            return (25.0, 25.0, 25.0, 25.0)
+        inv = 100.0 / total
+        return (int(c[0]) * inv, int(c[1]) * inv, int(c[2]) * inv, int(c[3]) * inv)
 
     def get_direction_distribution(self) -> Dict[str, float]:
         """
         Calculate direction distribution as percentages.
         
-        Ideal distribution for unbiased RNG: 25% each direction.
+        Dict adapter over get_direction_percentages for callers that look
+        directions up by name.
         
         Returns:
             Dictionary mapping direction to percentage.
         """
-        total = sum(self.direction_counts.values())
-        if total == 0:
-            return {'UP': 25.0, 'DOWN': 25.0, 'LEFT': 25.0, 'RIGHT': 25.0}
-        return {k: (v / total) * 100 for k, v in self.direction_counts.items()}
+        return dict(zip(DIRECTION_NAMES, self.get_direction_percentages()))
 
     def get_max_heat(self) -> int:
         """
@@ -186,36 +692,46 @@ class StatsTracker:
         Returns:
             Maximum visit count across all cells.
         """
-        max_heat = 0
-        for row in self.heatmap:
-            row_max = max(row) if row else 0
-            if row_max > max_heat:
-                max_heat = row_max
-        return max_heat if max_heat > 0 else 1
+        return self._max_heat if self._max_heat > 0 else 1
 
     def get_stats_dict(self) -> Dict[str, float]:
         """
         Get all statistics as a dictionary for display.
         
+        The result is cached until the next recorded move or reset, so
+        repeated queries between moves do not rescan the histories.
+        
         Returns:
             Dictionary with all computed metrics.
         """
-        return {
-            'dispersao': self.get_dispersao(),
-            'retorno_rate': self.get_retorno_rate(),
-            'entropia': self.get_entropia(),
-            'total_moves': self.total_moves,
-            'return_count': self.return_count
-        }
+        if self._stats_dirty:
+            self._stats_cache = {
+                'dispersao': self.get_dispersao(),
+                'retorno_rate': self.get_retorno_rate(),
+                'entropia': self.get_entropia(),
+                'total_moves': self.total_moves,
+                'return_count': self.return_count
+            }
+            self._stats_dirty = False
+        return dict(self._stats_cache)
 
     def reset(self) -> None:
         """Reset all statistics to initial state."""
-        self.heatmap = [[0] * self.grid_width for _ in range(self.grid_height)]
-        self.direction_history = []
-        self.direction_counts = {'UP': 0, 'DOWN': 0, 'LEFT': 0, 'RIGHT': 0}
-        self.distance_history = []
+        self.heatmap = np.zeros((self.grid_height, self.grid_width), dtype=np.uint16)
+        self.heat_version += 1
+        self._max_heat = 0
+        self._dir_ring = np.zeros(self.max_history, dtype=np.uint8)
+        self._dir_idx = 0
+        self._dir_count = 0
+        self._window_counts = np.zeros(len(DIRECTION_NAMES), dtype=np.int64)
+        self.direction_counts = np.zeros(len(DIRECTION_NAMES), dtype=np.int64)
+        self._dist_ring = np.zeros(self.max_distance_history, dtype=np.float32)
+        self._dist_idx = 0
+        self._dist_count = 0
+        self._dist_hist = np.zeros(self._num_dist_buckets, dtype=np.int32)
         self.return_count = 0
         self.total_moves = 0
         self.distance_sum = 0.0
+        self._stats_dirty = True
 
 
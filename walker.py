@@ -1,8 +1,14 @@
+from collections import deque
+
+import numpy as np
 import pygame
-from typing import List, Tuple, Literal
+from typing import Deque, Optional, Sequence, Tuple
+
+from directions import DIRECTION_INDEX, Direction
 
-# Type alias for directions
-Direction = Literal['UP', 'DOWN', 'LEFT', 'RIGHT']
+# Unit step per direction index, in DIRECTION_NAMES order (see directions.py)
+DX: Tuple[int, ...] = (0, 0, -1, 1)
+DY: Tuple[int, ...] = (-1, 1, 0, 0)
 
 class RandomWalker:
     """
@@ -13,10 +19,12 @@ class RandomWalker:
         y (int): Current y-coordinate.
         color (Tuple[int, int, int]): RGB color of the walker's trail.
         step_size (int): Checkpoint distance per move.
-        path (List[Tuple[int, int]]): History of visited coordinates.
+        path (Deque[Tuple[int, int]]): History of visited coordinates, oldest evicted first.
         max_history (int): Maximum number of points to keep in path history.
     """
 
+    __slots__ = ('x', 'y', 'color', 'step_size', 'path', 'max_history')
+
     def __init__(self, x: int, y: int, color: Tuple[int, int, int], step_size: int = 2, max_history: int = 1000):
         """
         Initialize the RandomWalker.
@@ -32,41 +40,103 @@ class RandomWalker:
         self.y = y
         self.color = color
         self.step_size = step_size
-        self.path: List[Tuple[int, int]] = []
+        self.path: Deque[Tuple[int, int]] = deque(maxlen=max_history)
         self.max_history = max_history
 
-    def move(self, direction: Direction) -> None:
+    def move(self, direction: int) -> None:
         """
         Update position based on directional input.
 
         Args:
-            direction: One of 'UP', 'DOWN', 'LEFT', 'RIGHT'.
+            direction: Direction index (0=UP, 1=DOWN, 2=LEFT, 3=RIGHT).
         """
-        if direction == 'UP':
-            self.y -= self.step_size
-        elif direction == 'DOWN':
-            self.y += self.step_size
-        elif direction == 'LEFT':
-            self.x -= self.step_size
-        elif direction == 'RIGHT':
-            self.x += self.step_size
+        self.x += DX[direction] * self.step_size
+        self.y += DY[direction] * self.step_size
         
-        # Append to path
+        # Append to path; the deque drops the oldest point beyond max_history
         self.path.append((self.x, self.y))
-        
-        # Limit path history for performance (logic retention)
-        if len(self.path) > self.max_history:
-            self.path.pop(0)
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def move_named(self, direction: Direction) -> None:
+        """
+        Update position from a direction name.
+
+        Args:
+            direction: One of 'UP', 'DOWN', 'LEFT', 'RIGHT'.
+        """
+        self.move(DIRECTION_INDEX[direction])
+
+    def draw(self, surface: pygame.Surface, trail_surface: Optional[pygame.Surface] = None) -> None:
         """
         Draw the walker's current head and immediate path segment.
         
+        Only the newest segment is drawn, so the trail is expected to
+        accumulate on a persistent surface that is blitted once per frame.
+        
         Args:
-            surface: The display surface to draw onto.
+            surface: The display surface to draw the head onto.
+            trail_surface: Persistent surface for the trail; defaults to surface.
         """
         if len(self.path) > 1:
-            pygame.draw.lines(surface, self.color, False, self.path, 1)
+            target = trail_surface if trail_surface is not None else surface
+            pygame.draw.line(target, self.color, self.path[-2], self.path[-1], 1)
         
         # Draw head
         pygame.draw.circle(surface, (255, 255, 255), (self.x, self.y), 3)
+
+
+class WalkerSwarm:
+    """
+    A group of walkers stored as parallel arrays (structure of arrays).
+
+    All walkers advance together in one vectorized step, instead of one
+    RandomWalker.move() call per agent.
+
+    Attributes:
+        xs (np.ndarray): int32 x-coordinates, one per walker.
+        ys (np.ndarray): int32 y-coordinates, one per walker.
+        colors (np.ndarray): (N, 3) uint8 RGB trail color per walker.
+        step_size (int): Pixels moved per step.
+        bounds (Tuple[int, int, int, int]): Inclusive (x_min, y_min, x_max, y_max) clamp box.
+    """
+
+    def __init__(self, x: int, y: int, colors: Sequence[Tuple[int, int, int]],
+                 bounds: Tuple[int, int, int, int], step_size: int = 2):
+        """
+        Initialize the swarm with every walker at the same starting point.
+
+        Args:
+            x: Initial x-coordinate.
+            y: Initial y-coordinate.
+            colors: RGB tuple per walker; its length sets the swarm size.
+            bounds: Inclusive (x_min, y_min, x_max, y_max) positions are clamped to.
+            step_size: Pixels to move per step.
+        """
+        count = len(colors)
+        self.xs = np.full(count, x, dtype=np.int32)
+        self.ys = np.full(count, y, dtype=np.int32)
+        self.colors = np.array(colors, dtype=np.uint8).reshape(count, 3)
+        self.step_size = step_size
+        self.bounds = bounds
+        self._dx = np.array(DX, dtype=np.int32) * step_size
+        self._dy = np.array(DY, dtype=np.int32) * step_size
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def step(self, directions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Move every walker one step and clamp it to the swarm bounds.
+
+        Args:
+            directions: Direction index per walker (0=UP, 1=DOWN, 2=LEFT, 3=RIGHT).
+
+        Returns:
+            Tuple of (previous xs, previous ys).
+        """
+        old_xs, old_ys = self.xs.copy(), self.ys.copy()
+        x_min, y_min, x_max, y_max = self.bounds
+        self.xs += self._dx[directions]
+        self.ys += self._dy[directions]
+        np.clip(self.xs, x_min, x_max, out=self.xs)
+        np.clip(self.ys, y_min, y_max, out=self.ys)
+        return old_xs, old_ys